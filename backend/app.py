@@ -13,48 +13,186 @@ Optional environment variables:
 
 Optional system dependencies (for voice memo support):
     - ffmpeg (audio conversion)
-    - openai-whisper (speech-to-text transcription)
+    - faster-whisper or openai-whisper (speech-to-text transcription)
 """
 
+import copy
+import gzip
+import hashlib
+import importlib.util
 import json
+import math
 import os
+import re
 import uuid
 import tempfile
 import subprocess
 import time
 import secrets
+import stat
+import threading
 import requests
-from datetime import datetime, timedelta
-from collections import Counter
-from functools import wraps
-
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import islice
+from operator import itemgetter
+
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import anthropic
 
+try:
+    import orjson
+except ImportError:  # optional — responses fall back to the stdlib encoder
+    orjson = None
+
+# JSON decoding for the session log, cache files and Claude replies. Files are
+# still written with the stdlib encoder (ASCII-only output). orjson's
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # ---------------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------------
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Encode jsonify() responses with orjson, honoring sort_keys and compact like the default provider."""
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder (and
+            # request.get_json) accept — don't let one stored value 500 every read
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+# Responses are read by the frontend, not people: skip the per-response key
+# sort and the debug-mode indentation
+app.json.sort_keys = False
+app.json.compact = True
 
 frontend_url = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 CORS(app, origins=[frontend_url, "http://localhost:3000"])
 
 DATA_DIR = os.environ.get("DATA_DIR", os.path.join(os.path.dirname(__file__), "data"))
-DATA_FILE = os.path.join(DATA_DIR, "sessions.json")
-COURSE_CACHE_FILE = os.path.join(DATA_DIR, "course_cache.json")
+DATA_FILE = os.path.join(DATA_DIR, "sessions.json")  # legacy format, migrated to SESSIONS_LOG
+SESSIONS_LOG = os.path.join(DATA_DIR, "sessions.jsonl")
+COURSE_CACHE_DIR = os.path.join(DATA_DIR, "course_cache")  # one <course_id>.json per course
+COURSE_CACHE_FILE = os.path.join(DATA_DIR, "course_cache.json")  # legacy, split into COURSE_CACHE_DIR
 CUSTOM_TEES_FILE = os.path.join(DATA_DIR, "custom_tees.json")
+COACHING_CACHE_FILE = os.path.join(DATA_DIR, "coaching_cache.json")
 
-# Claude model used for all AI features
+# Claude model used for coaching, and a faster one for the JSON extraction
+# calls (note and voice memo parsing) where latency matters more
 CLAUDE_MODEL = "claude-sonnet-4-5-20250514"
+CLAUDE_FAST_MODEL = "claude-haiku-4-5"
 
 # Golf Course API
 GOLF_COURSE_API_URL = "https://api.golfcourseapi.com"
+GOLF_COURSE_API_TIMEOUT = (3, 10)  # (connect, read) seconds — fail fast on an unreachable host
 COURSE_CACHE_MAX_AGE_DAYS = 30
 
-# In-memory search cache to reduce API calls (query -> {results, timestamp})
-_search_cache = {}
+# Shared HTTP session for GolfCourseAPI calls — keeps TCP/TLS connections alive
+# between requests and retries transient connection errors / 5xx responses
+_golf_http = requests.Session()
+_golf_http.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False),
+))
+
+# In-memory search cache to reduce API calls (query -> {results, timestamp}),
+# bounded LRU: least recently used queries are evicted first
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_MAX_ENTRIES = 2048
+_search_cache = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# Same for the debug /raw endpoint (course_id -> {data, timestamp})
+RAW_COURSE_CACHE_TTL_SECONDS = 300
+RAW_COURSE_CACHE_MAX_ENTRIES = 256
+_raw_course_cache = OrderedDict()
+_raw_course_cache_lock = threading.Lock()
+
+# Parsed course cache files (path -> (mtime_ns, size, entry)), so repeat
+# lookups of a course skip the read and JSON parse until its file changes;
+# bounded LRU
+COURSE_MEMO_MAX_ENTRIES = 256
+_course_memo = OrderedDict()
+_course_memo_lock = threading.Lock()
+
+# Last AI coaching reply per kind ("advice"/"summary"), keyed by a hash of the
+# session summary it was generated from — unchanged history is answered from disk
+COACHING_CACHE_MAX_AGE_HOURS = 24
+_coaching_cache_lock = threading.Lock()
+
+# Claude note parses by hash of the notes text, so identical notes (re-imports,
+# duplicated sessions) don't pay for another call; bounded LRU
+NOTES_PARSE_CACHE_MAX_ENTRIES = 512
+_notes_parse_cache = OrderedDict()
+_notes_parse_cache_lock = threading.Lock()
+
+# How often a background notes re-parse checks whether its Message Batch is done
+NOTES_BATCH_POLL_SECONDS = 30
+# Id of the re-parse batch in flight, if any — one at a time
+_notes_batch = {"id": None}
+_notes_batch_lock = threading.Lock()
+
+# Sessions are stored as an append-only JSON Lines log: one session per line,
+# a later line with the same id replaces the earlier one, and {"_deleted": id}
+# lines are tombstones. The log is rewritten (compacted) once stale lines pile up.
+SESSIONS_LOG_COMPACT_MIN_STALE = 50
+
+# Parsed copy of the sessions log, keyed by its mtime/size so repeat reads skip
+# the JSON parse until the file changes on disk (data: id -> session, in order)
+_sessions_cache = {"mtime": None, "size": None, "data": None, "stale": 0}
+
+# Last /api/stats response body (already JSON-encoded, plain and gzipped) and
+# the (sessions version, date) it was computed for, stored together as one
+# (key, body, gzipped body) tuple — stats only change when sessions do or the
+# day rolls over
+_stats_cache = {"entry": None}
+
+# How long the browser may reuse a /api/stats response before revalidating it;
+# the frontend forces a revalidation itself after creating or deleting a session
+STATS_BROWSER_MAX_AGE_SECONDS = 30
+
+# Guards the sessions log and its cache — request threads and background
+# workers both append to it
+_sessions_lock = threading.RLock()
+
+# Background workers for slow Claude calls that shouldn't block a response
+_background_executor = ThreadPoolExecutor(max_workers=4)
+
+# Shared Anthropic client — one connection pool reused by every Claude call
+_claude_client = None
+_claude_client_lock = threading.Lock()
+
+# Whisper model size for /api/transcribe; loaded once on first use and kept.
+# faster-whisper is used when installed, otherwise openai-whisper.
+WHISPER_MODEL = os.environ.get("WHISPER_MODEL", "base")
+_whisper_model = None
+_whisper_backend = None  # "faster-whisper" or "openai-whisper" once loaded
+_whisper_model_lock = threading.Lock()
+# Loads the model in the background while a request's audio is decoded
+_whisper_load_executor = ThreadPoolExecutor(max_workers=1)
 
 # ---------------------------------------------------------------------------
 # Authentication
@@ -110,26 +248,203 @@ def auth_verify():
 # ---------------------------------------------------------------------------
 
 
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(path, text):
+    """
+    Write text to a temp file in one call and swap it into place with
+    os.replace. Each write gets its own temp file, so concurrent writers of
+    the same path can't clobber each other's half-written data.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        # mkstemp creates the file 0600 — keep the mode a plain open() would give
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_json(path, obj, indent=None):
+    """Serialize obj in memory and write it atomically (compact unless indent is given)."""
+    _atomic_write(path, json.dumps(obj, indent=indent))
+
+
 def _ensure_data_file():
-    """Create the data directory and sessions file if they don't exist."""
+    """
+    Create the data directory and sessions log if they don't exist. An existing
+    legacy sessions.json is migrated into the log (oldest first) on first run,
+    and a legacy course_cache.json is split into per-course files.
+    """
     os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "w") as f:
-            json.dump([], f)
+    if os.path.exists(COURSE_CACHE_FILE):
+        _migrate_course_cache()
+    if os.path.exists(SESSIONS_LOG):
+        return
+    sessions = []
+    if os.path.exists(DATA_FILE):
+        try:
+            with open(DATA_FILE, "r") as f:
+                sessions = json.load(f)
+            if not isinstance(sessions, list):
+                raise ValueError("expected a JSON array")
+            sessions.sort(key=lambda s: s.get("created_at", ""))
+            print(f"[Sessions] Migrating {len(sessions)} sessions from {DATA_FILE} to {SESSIONS_LOG}")
+        except (OSError, ValueError, AttributeError) as e:
+            # Don't take the app down at boot; the legacy file is left in place
+            # untouched so it can be repaired and re-imported by hand
+            print(f"[Sessions] Could not migrate {DATA_FILE}, starting with an empty log: {e}")
+            sessions = []
+    _write_sessions(sessions)
+
+
+def _load_sessions_log():
+    """Replay the sessions log. Returns (id -> session dict, number of stale lines)."""
+    by_id = {}
+    lines = 0
+    with open(SESSIONS_LOG, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            lines += 1
+            try:
+                record = _json_loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append — skip it
+                print(f"[Sessions] Skipping unreadable line {lines} in {SESSIONS_LOG}")
+                continue
+            if "_deleted" in record:
+                by_id.pop(record["_deleted"], None)
+            else:
+                by_id[record["id"]] = record
+    return by_id, lines - len(by_id)
 
 
 def _read_sessions():
-    """Read all sessions from the JSON file."""
-    _ensure_data_file()
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    """
+    Read all sessions from the log, in the order they were created. The parsed
+    sessions are cached in memory and reused until the log's mtime or size
+    changes. Returns a new list each call, but the session dicts are shared
+    with the cache — don't mutate them.
+    """
+    return list(_refresh_sessions_cache()["data"].values())
+
+
+def _refresh_sessions_cache():
+    """Re-read the sessions log into the cache if it changed on disk; return the cache."""
+    with _sessions_lock:
+        st = _stat_sessions_log()
+        cache = _sessions_cache
+        if cache["data"] is None or cache["mtime"] != st.st_mtime_ns or cache["size"] != st.st_size:
+            data, stale = _load_sessions_log()
+            cache.update(mtime=st.st_mtime_ns, size=st.st_size, data=data, stale=stale)
+        return cache
+
+
+def _stat_sessions_log():
+    """
+    os.stat the sessions log. The data directory is set up once at startup;
+    this only falls back to _ensure_data_file() if it was removed since.
+    """
+    try:
+        return os.stat(SESSIONS_LOG)
+    except FileNotFoundError:
+        _ensure_data_file()
+        return os.stat(SESSIONS_LOG)
+
+
+def _get_session(session_id):
+    """Return the stored session with this id, or None."""
+    with _sessions_lock:
+        return _refresh_sessions_cache()["data"].get(session_id)
+
+
+def _sessions_version():
+    """Return a token that changes whenever the sessions log changes."""
+    with _sessions_lock:
+        cache = _refresh_sessions_cache()
+        return (cache["mtime"], cache["size"])
+
+
+def _append_session_records(records):
+    """
+    Append session records (full sessions or {"_deleted": id} tombstones) to the
+    log with a single write, keeping the in-memory cache in step when possible.
+    """
+    with _sessions_lock:
+        payload = "".join(json.dumps(r) + "\n" for r in records)
+        before = _stat_sessions_log()
+        with open(SESSIONS_LOG, "a+b") as f:
+            if before.st_size:
+                # Start on a fresh line if a previous append was cut short
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = "\n" + payload
+            f.write(payload.encode("utf-8"))
+        after = os.stat(SESSIONS_LOG)
+
+        cache = _sessions_cache
+        in_step = (
+            cache["data"] is not None
+            and cache["mtime"] == before.st_mtime_ns
+            and cache["size"] == before.st_size
+            and after.st_size == before.st_size + len(payload.encode("utf-8"))
+        )
+        if not in_step:
+            # Another process touched the log; the next read will replay it
+            cache["data"] = None
+            return
+        data = cache["data"]
+        for record in records:
+            if "_deleted" in record:
+                if data.pop(record["_deleted"], None) is None:
+                    cache["stale"] += 1
+                else:
+                    cache["stale"] += 2
+            else:
+                if record["id"] in data:
+                    cache["stale"] += 1
+                data[record["id"]] = record
+        cache.update(mtime=after.st_mtime_ns, size=after.st_size)
 
 
 def _write_sessions(sessions):
-    """Write sessions list to the JSON file."""
-    _ensure_data_file()
-    with open(DATA_FILE, "w") as f:
-        json.dump(sessions, f, indent=2)
+    """
+    Rewrite the whole sessions log (compaction) and refresh the in-memory cache.
+    Writes to a temp file and swaps it in so readers never see a partial log.
+    """
+    with _sessions_lock:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _atomic_write(SESSIONS_LOG, "".join(json.dumps(s) + "\n" for s in sessions))
+        st = os.stat(SESSIONS_LOG)
+        _sessions_cache.update(
+            mtime=st.st_mtime_ns,
+            size=st.st_size,
+            data={s["id"]: s for s in sessions},
+            stale=0,
+        )
+
+
+def _compact_sessions_log_if_needed():
+    """Rewrite the log once stale lines outnumber live sessions (and the minimum)."""
+    with _sessions_lock:
+        sessions = _read_sessions()
+        stale = _sessions_cache["stale"]
+        if stale >= SESSIONS_LOG_COMPACT_MIN_STALE and stale > len(sessions):
+            _write_sessions(sessions)
 
 
 # ---------------------------------------------------------------------------
@@ -137,39 +452,94 @@ def _write_sessions(sessions):
 # ---------------------------------------------------------------------------
 
 
-def _read_course_cache():
-    """Read the course cache from disk."""
-    if not os.path.exists(COURSE_CACHE_FILE):
-        return {}
-    with open(COURSE_CACHE_FILE, "r") as f:
-        return json.load(f)
+# Course ids are used as file names; anything else is hashed
+_SAFE_CACHE_KEY_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
 
 
-def _write_course_cache(cache):
-    """Write the course cache to disk."""
-    _ensure_data_file()
-    with open(COURSE_CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=2)
+def _course_cache_path(course_id):
+    """Return the cache file path for a course."""
+    key = str(course_id)
+    if not _SAFE_CACHE_KEY_RE.fullmatch(key):
+        key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(COURSE_CACHE_DIR, key + ".json")
+
+
+def _migrate_course_cache():
+    """
+    Split a legacy single-file course_cache.json into per-course files. An
+    unreadable legacy file is moved aside (it's only a cache) rather than
+    keeping the app from starting.
+    """
+    try:
+        with open(COURSE_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            raise ValueError("expected a JSON object")
+    except (OSError, ValueError) as e:
+        print(f"[Course cache] Skipping migration of unreadable {COURSE_CACHE_FILE}: {e}")
+        try:
+            os.replace(COURSE_CACHE_FILE, COURSE_CACHE_FILE + ".corrupt")
+        except OSError:
+            pass
+        return
+    os.makedirs(COURSE_CACHE_DIR, exist_ok=True)
+    for course_id, entry in cache.items():
+        _atomic_write_json(_course_cache_path(course_id), entry)
+    os.remove(COURSE_CACHE_FILE)
+    print(f"[Course cache] Migrated {len(cache)} courses to {COURSE_CACHE_DIR}")
 
 
 def _get_cached_course(course_id):
-    """Get course details from cache if fresh (within COURSE_CACHE_MAX_AGE_DAYS)."""
-    cache = _read_course_cache()
-    key = str(course_id)
-    if key in cache:
-        entry = cache[key]
-        cached_at = datetime.fromisoformat(entry.get("_cached_at", "2000-01-01"))
-        if (datetime.now() - cached_at).days < COURSE_CACHE_MAX_AGE_DAYS:
-            return entry
+    """
+    Get course details from cache if fresh (within COURSE_CACHE_MAX_AGE_DAYS).
+    The parsed file is memoized in memory until its mtime or size changes;
+    callers get their own copy of the tee list to merge custom tees into.
+    """
+    path = _course_cache_path(course_id)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        with _course_memo_lock:
+            _course_memo.pop(path, None)
+        return None
+    with _course_memo_lock:
+        memo = _course_memo.get(path)
+        if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+            _course_memo.move_to_end(path)
+            entry = memo[2]
+        else:
+            entry = None
+    if entry is None:
+        try:
+            with open(path, "r") as f:
+                entry = _json_loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        with _course_memo_lock:
+            _course_memo[path] = (st.st_mtime_ns, st.st_size, entry)
+            _course_memo.move_to_end(path)
+            while len(_course_memo) > COURSE_MEMO_MAX_ENTRIES:
+                _course_memo.popitem(last=False)
+    cached_at = datetime.fromisoformat(entry.get("_cached_at", "2000-01-01"))
+    if (datetime.now() - cached_at).days < COURSE_CACHE_MAX_AGE_DAYS:
+        # _merge_custom_tees edits the tee list and tee dicts in place
+        return dict(entry, tees=[dict(t) for t in entry.get("tees", [])])
     return None
 
 
 def _set_cached_course(course_id, data):
-    """Store course details in disk cache with a timestamp."""
-    cache = _read_course_cache()
+    """Store course details in its own cache file with a timestamp."""
+    os.makedirs(COURSE_CACHE_DIR, exist_ok=True)
     data["_cached_at"] = datetime.now().isoformat()
-    cache[str(course_id)] = data
-    _write_course_cache(cache)
+    _atomic_write_json(_course_cache_path(course_id), data)
+
+
+def _invalidate_cached_course(course_id):
+    """Drop a course's cache file so the next fetch rebuilds it."""
+    try:
+        os.remove(_course_cache_path(course_id))
+    except FileNotFoundError:
+        pass
 
 
 def _read_custom_tees():
@@ -177,14 +547,90 @@ def _read_custom_tees():
     if not os.path.exists(CUSTOM_TEES_FILE):
         return {}
     with open(CUSTOM_TEES_FILE, "r") as f:
-        return json.load(f)
+        return _json_loads(f.read())
 
 
 def _write_custom_tees(data):
     """Write custom tees to disk."""
     _ensure_data_file()
-    with open(CUSTOM_TEES_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    _atomic_write_json(CUSTOM_TEES_FILE, data, indent=2)
+
+
+def _get_cached_search(query_key):
+    """Return cached search results if present and fresh, else None."""
+    with _search_cache_lock:
+        entry = _search_cache.get(query_key)
+        if entry is None:
+            return None
+        if time.time() - entry["ts"] >= SEARCH_CACHE_TTL_SECONDS:
+            del _search_cache[query_key]
+            return None
+        _search_cache.move_to_end(query_key)
+        return entry["results"]
+
+
+def _set_cached_search(query_key, results):
+    """Cache search results, evicting the least recently used queries past the cap."""
+    with _search_cache_lock:
+        _search_cache[query_key] = {"results": results, "ts": time.time()}
+        _search_cache.move_to_end(query_key)
+        while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+
+
+def _get_cached_raw_course(course_id):
+    """Return a cached raw course response if present and fresh, else None."""
+    with _raw_course_cache_lock:
+        entry = _raw_course_cache.get(course_id)
+        if entry is None:
+            return None
+        if time.time() - entry["ts"] >= RAW_COURSE_CACHE_TTL_SECONDS:
+            del _raw_course_cache[course_id]
+            return None
+        _raw_course_cache.move_to_end(course_id)
+        return entry["data"]
+
+
+def _set_cached_raw_course(course_id, data):
+    """Cache a raw course response, evicting the least recently used past the cap."""
+    with _raw_course_cache_lock:
+        _raw_course_cache[course_id] = {"data": data, "ts": time.time()}
+        _raw_course_cache.move_to_end(course_id)
+        while len(_raw_course_cache) > RAW_COURSE_CACHE_MAX_ENTRIES:
+            _raw_course_cache.popitem(last=False)
+
+
+def _coaching_cache_key(kind, summary):
+    """Hash of everything that determines a coaching reply."""
+    return hashlib.sha256(f"{CLAUDE_MODEL}\n{kind}\n{summary}".encode()).hexdigest()
+
+
+def _read_coaching_cache():
+    """Read the coaching reply cache from disk."""
+    try:
+        with open(COACHING_CACHE_FILE, "r") as f:
+            return _json_loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _get_cached_coaching(kind, summary):
+    """Return the cached reply for this exact session summary if fresh, else None."""
+    entry = _read_coaching_cache().get(kind)
+    if not entry or entry.get("key") != _coaching_cache_key(kind, summary):
+        return None
+    if time.time() - entry.get("ts", 0) >= COACHING_CACHE_MAX_AGE_HOURS * 3600:
+        return None
+    return entry["text"]
+
+
+def _set_cached_coaching(kind, summary, text):
+    """Store a coaching reply, replacing the previous one of the same kind."""
+    with _coaching_cache_lock:
+        cache = _read_coaching_cache()
+        cache[kind] = {"key": _coaching_cache_key(kind, summary), "text": text, "ts": time.time()}
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _atomic_write_json(COACHING_CACHE_FILE, cache)
 
 
 def _golf_api_headers():
@@ -201,18 +647,53 @@ def _golf_api_headers():
 # ---------------------------------------------------------------------------
 
 
-import re
+# Trailing parenthetical year/info on a tee name, e.g. "Blue (2023)"
+_TEE_PAREN_RE = re.compile(r'\s*\([^)]*\)\s*$')
 
 
+@lru_cache(maxsize=1024)
 def _clean_tee_name(raw_name):
     """Clean a tee name from scorecard data (remove trailing colons, parens, etc.)."""
     name = raw_name.strip().rstrip(":")
     # Remove parenthetical year/info e.g. "Blue (2023)"
-    name = re.sub(r'\s*\([^)]*\)\s*$', '', name)
+    name = _TEE_PAREN_RE.sub('', name)
     # Remove leading/trailing whitespace
     return name.strip()
 
 
+# Row-format scorecard keys that label the row or hold totals, not hole numbers
+_SCORECARD_NON_HOLE_KEYS = frozenset(("Hole:", "Hole", "Out", "In", "Total"))
+
+
+def _scorecard_int(value):
+    """
+    Convert a scorecard cell to an int, or return None if it isn't one.
+    Obvious non-numbers (labels like "Out", blanks) are rejected with a cheap
+    string check instead of raising and catching ValueError.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and not value.strip().lstrip("+-").isdigit():
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _scorecard_row_holes(row):
+    """Return {hole_num: int value} for one row-format scorecard row."""
+    holes = {}
+    for key, val in row.items():
+        if key in _SCORECARD_NON_HOLE_KEYS:
+            continue
+        hole_num = _scorecard_int(key)
+        value = _scorecard_int(val)
+        if hole_num is not None and value is not None:
+            holes[hole_num] = value
+    return holes
+
+
 def _parse_scorecard_row_format(rows):
     """
     Parse the row-based scorecard format where each row is a dict like:
@@ -228,38 +709,15 @@ def _parse_scorecard_row_format(rows):
         label = label_raw.rstrip(":").strip().lower()
 
         if label == "par":
-            for key, val in row.items():
-                if key in ("Hole:", "Hole", "Out", "In", "Total"):
-                    continue
-                try:
-                    hole_num = int(key)
-                    par_holes[hole_num] = int(val)
-                except (ValueError, TypeError):
-                    pass
+            par_holes.update(_scorecard_row_holes(row))
 
         elif label == "handicap" or label == "hdcp":
-            for key, val in row.items():
-                if key in ("Hole:", "Hole", "Out", "In", "Total"):
-                    continue
-                try:
-                    hole_num = int(key)
-                    handicap_holes[hole_num] = int(val)
-                except (ValueError, TypeError):
-                    pass
+            handicap_holes.update(_scorecard_row_holes(row))
 
         elif label and label not in ("hole", ""):
             # This is a tee row
             tee_name = _clean_tee_name(label_raw.rstrip(":"))
-            hole_yards = {}
-            for key, val in row.items():
-                if key in ("Hole:", "Hole", "Out", "In", "Total"):
-                    continue
-                try:
-                    hole_num = int(key)
-                    yards = int(val)
-                    hole_yards[hole_num] = yards
-                except (ValueError, TypeError):
-                    pass
+            hole_yards = _scorecard_row_holes(row)
             # Skip if all zeros or empty
             if hole_yards and sum(hole_yards.values()) > 0:
                 tee_yardages[tee_name] = hole_yards
@@ -282,17 +740,13 @@ def _parse_scorecard_perhole_format(rows):
         if hole_num is None:
             continue
 
-        if entry.get("Par") is not None:
-            try:
-                par_holes[hole_num] = int(entry["Par"])
-            except (ValueError, TypeError):
-                pass
+        par = _scorecard_int(entry.get("Par"))
+        if par is not None:
+            par_holes[hole_num] = par
 
-        if entry.get("Handicap") is not None:
-            try:
-                handicap_holes[hole_num] = int(entry["Handicap"])
-            except (ValueError, TypeError):
-                pass
+        handicap = _scorecard_int(entry.get("Handicap"))
+        if handicap is not None:
+            handicap_holes[hole_num] = handicap
 
         tees = entry.get("tees", {})
         for tee_key, tee_data in tees.items():
@@ -302,10 +756,9 @@ def _parse_scorecard_perhole_format(rows):
             if yards is not None:
                 if tee_name not in tee_yardages:
                     tee_yardages[tee_name] = {}
-                try:
-                    tee_yardages[tee_name][hole_num] = int(yards)
-                except (ValueError, TypeError):
-                    pass
+                yards = _scorecard_int(yards)
+                if yards is not None:
+                    tee_yardages[tee_name][hole_num] = yards
 
     return par_holes, tee_yardages, handicap_holes
 
@@ -315,18 +768,31 @@ def _parse_scorecard(scorecard_raw):
     Parse scorecard data from the API. The scorecard field is a JSON string.
     Detects which format (row-based or per-hole) and returns normalized data.
     Returns: {par, handicap, tee_yardages} or None
+
+    String scorecards are memoized and the result is shared between calls —
+    copy any part that is kept or modified.
     """
     if not scorecard_raw:
         return None
 
+    if isinstance(scorecard_raw, str):
+        # The same course is viewed repeatedly, so memoize on the raw string
+        return _parse_scorecard_str(scorecard_raw)
+    return _parse_scorecard_rows(scorecard_raw)
+
+
+@lru_cache(maxsize=128)
+def _parse_scorecard_str(scorecard_str):
+    """Decode a JSON scorecard string and parse it (memoized)."""
     try:
-        if isinstance(scorecard_raw, str):
-            rows = json.loads(scorecard_raw)
-        else:
-            rows = scorecard_raw
-    except (json.JSONDecodeError, TypeError):
+        rows = _json_loads(scorecard_str)
+    except json.JSONDecodeError:
         return None
+    return _parse_scorecard_rows(rows)
 
+
+def _parse_scorecard_rows(rows):
+    """Parse already-decoded scorecard rows (see _parse_scorecard)."""
     if not isinstance(rows, list) or len(rows) == 0:
         return None
 
@@ -351,15 +817,13 @@ def _parse_scorecard(scorecard_raw):
         return None
 
     num_holes = max(all_holes)
-    hole_range = list(range(1, num_holes + 1))
+    hole_range = range(1, num_holes + 1)
 
-    # Build par structure
+    # Build par structure (per-hole list first; front/back sums come off it)
     par_list = [par_holes.get(h, 0) for h in hole_range]
-    front_holes = [h for h in hole_range if h <= 9]
-    back_holes = [h for h in hole_range if h > 9]
-    par_front = sum(par_holes.get(h, 0) for h in front_holes)
-    par_back = sum(par_holes.get(h, 0) for h in back_holes)
-    par_total = par_front + par_back
+    par_total = sum(par_list)
+    par_front = sum(islice(par_list, 9))
+    par_back = par_total - par_front
 
     par_data = {
         "total": par_total if par_total > 0 else None,
@@ -368,17 +832,17 @@ def _parse_scorecard(scorecard_raw):
         "holes": par_list,
     }
 
-    # Build handicap list
-    handicap_list = [handicap_holes.get(h) for h in hole_range]
-    has_handicap = any(v is not None for v in handicap_list)
+    # Build handicap list (only present if some hole in range has a handicap)
+    has_handicap = not handicap_holes.keys().isdisjoint(hole_range)
+    handicap_list = [handicap_holes.get(h) for h in hole_range] if has_handicap else None
 
     # Build tee data
     tees_parsed = {}
     for tee_name, hole_yards in tee_yardages.items():
         yard_list = [hole_yards.get(h, 0) for h in hole_range]
-        front_yds = sum(hole_yards.get(h, 0) for h in front_holes)
-        back_yds = sum(hole_yards.get(h, 0) for h in back_holes)
-        total_yds = front_yds + back_yds
+        total_yds = sum(yard_list)
+        front_yds = sum(islice(yard_list, 9))
+        back_yds = total_yds - front_yds
         tees_parsed[tee_name] = {
             "hole_yardages": yard_list,
             "front_yardage": front_yds,
@@ -388,7 +852,7 @@ def _parse_scorecard(scorecard_raw):
 
     return {
         "par": par_data,
-        "handicap": handicap_list if has_handicap else None,
+        "handicap": handicap_list,
         "tee_yardages": tees_parsed,
         "num_holes": num_holes,
     }
@@ -400,11 +864,25 @@ def _parse_scorecard(scorecard_raw):
 
 
 def _get_claude_client():
-    """Return an Anthropic client. Raises an error if the API key is missing."""
+    """
+    Return the shared Anthropic client, created on first use (and again if the
+    API key changes). Raises an error if the API key is missing.
+    """
+    global _claude_client
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable is not set.")
-    return anthropic.Anthropic(api_key=api_key)
+    client = _claude_client
+    if client is None or client.api_key != api_key:
+        with _claude_client_lock:
+            client = _claude_client
+            if client is None or client.api_key != api_key:
+                client = _claude_client = anthropic.Anthropic(api_key=api_key)
+    return client
+
+
+# Opening fence line (with optional language tag) or closing fence
+_CLAUDE_FENCE_RE = re.compile(r"\A```[^\n]*\n|```\Z")
 
 
 def _parse_claude_json(text):
@@ -413,13 +891,35 @@ def _parse_claude_json(text):
     wrapping (```json ... ```).
     """
     text = text.strip()
-    if text.startswith("```"):
-        # Remove opening fence (with optional language tag)
-        first_newline = text.index("\n")
-        text = text[first_newline + 1:]
-    if text.endswith("```"):
-        text = text[:-3]
-    return json.loads(text.strip())
+    if text[:1] not in ("{", "["):
+        # Not the common bare-JSON reply: drop a leading ```lang line and/or trailing ```
+        text = _CLAUDE_FENCE_RE.sub("", text)
+    return _json_loads(text)
+
+
+_NOTES_PARSE_SYSTEM = (
+    "You are a golf practice note parser. Extract structured insights "
+    "from the player's notes. Return ONLY valid JSON with these keys:\n"
+    '  "key_focus": a short string summarizing the main focus,\n'
+    '  "positives": array of strings — things that went well,\n'
+    '  "issues": array of strings — problems or struggles mentioned,\n'
+    '  "swing_thoughts": array of strings — any swing cues or thoughts,\n'
+    '  "equipment": array of strings — any clubs or equipment mentioned.\n'
+    "If a category has nothing relevant, use an empty array. "
+    "Do NOT wrap the JSON in markdown code fences."
+)
+
+
+def _notes_parse_cache_key(notes):
+    return hashlib.sha256(notes.encode("utf-8")).hexdigest()
+
+
+def _cache_notes_parse(notes_key, parsed):
+    with _notes_parse_cache_lock:
+        _notes_parse_cache[notes_key] = copy.deepcopy(parsed)
+        _notes_parse_cache.move_to_end(notes_key)
+        while len(_notes_parse_cache) > NOTES_PARSE_CACHE_MAX_ENTRIES:
+            _notes_parse_cache.popitem(last=False)
 
 
 def _parse_notes_with_claude(notes):
@@ -428,6 +928,13 @@ def _parse_notes_with_claude(notes):
     keys: key_focus, positives, issues, swing_thoughts, equipment.
     Returns None if the API key is not set or if parsing fails.
     """
+    notes_key = _notes_parse_cache_key(notes)
+    with _notes_parse_cache_lock:
+        cached = _notes_parse_cache.get(notes_key)
+        if cached is not None:
+            _notes_parse_cache.move_to_end(notes_key)
+            return copy.deepcopy(cached)
+
     try:
         client = _get_claude_client()
     except ValueError:
@@ -435,26 +942,112 @@ def _parse_notes_with_claude(notes):
 
     try:
         message = client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=1024,
-            system=(
-                "You are a golf practice note parser. Extract structured insights "
-                "from the player's notes. Return ONLY valid JSON with these keys:\n"
-                '  "key_focus": a short string summarizing the main focus,\n'
-                '  "positives": array of strings — things that went well,\n'
-                '  "issues": array of strings — problems or struggles mentioned,\n'
-                '  "swing_thoughts": array of strings — any swing cues or thoughts,\n'
-                '  "equipment": array of strings — any clubs or equipment mentioned.\n'
-                "If a category has nothing relevant, use an empty array. "
-                "Do NOT wrap the JSON in markdown code fences."
-            ),
+            model=CLAUDE_FAST_MODEL,
+            max_tokens=512,
+            system=_NOTES_PARSE_SYSTEM,
             messages=[{"role": "user", "content": notes}],
         )
-        return _parse_claude_json(message.content[0].text)
+        parsed = _parse_claude_json(message.content[0].text)
     except Exception as e:
         print(f"[AI parse error] {e}")
         return None
 
+    _cache_notes_parse(notes_key, parsed)
+    return parsed
+
+
+def _parse_session_notes_in_background(session_id, notes):
+    """
+    Executor task: parse a saved session's notes with Claude and patch the
+    insights onto the stored session (appended to the log as an updated record).
+    """
+    try:
+        parsed = _parse_notes_with_claude(notes)
+        if not parsed:
+            return
+        with _sessions_lock:
+            session = _get_session(session_id)
+            if session is None or session.get("ai_parsed"):
+                return  # Deleted (or already parsed) while Claude was working
+            _append_session_records([dict(session, ai_parsed=parsed)])
+    except Exception as e:
+        print(f"[AI background parse error] {e}")
+
+
+def _start_notes_batch(session_notes):
+    """
+    Submit a Message Batch parsing many sessions' notes (half the price of
+    individual calls) and start a daemon thread that waits for it. Returns
+    the batch id. session_notes is a list of (session_id, notes) pairs.
+    Callers hold _notes_batch_lock.
+    """
+    client = _get_claude_client()
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": session_id,
+                "params": {
+                    "model": CLAUDE_FAST_MODEL,
+                    "max_tokens": 512,
+                    "system": _NOTES_PARSE_SYSTEM,
+                    "messages": [{"role": "user", "content": notes}],
+                },
+            }
+            for session_id, notes in session_notes
+        ]
+    )
+    print(f"[AI batch] {batch.id}: parsing notes for {len(session_notes)} sessions")
+    _notes_batch["id"] = batch.id
+    # Batches can run for hours: poll on a thread of its own rather than
+    # tying up a _background_executor worker that note parses need
+    threading.Thread(
+        target=_finish_notes_batch, args=(batch.id, session_notes), daemon=True
+    ).start()
+    return batch.id
+
+
+def _finish_notes_batch(batch_id, session_notes):
+    """
+    Poller thread: wait for a notes batch to end, then patch every parsed
+    result onto its session in a single log write.
+    """
+    try:
+        client = _get_claude_client()
+        batch = client.messages.batches.retrieve(batch_id)
+        while batch.processing_status != "ended":
+            time.sleep(NOTES_BATCH_POLL_SECONDS)
+            batch = client.messages.batches.retrieve(batch_id)
+
+        notes_by_id = dict(session_notes)
+        parsed_by_id = {}
+        for entry in client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                print(f"[AI batch] {entry.custom_id}: {entry.result.type}")
+                continue
+            try:
+                parsed = _parse_claude_json(entry.result.message.content[0].text)
+            except Exception as e:
+                print(f"[AI batch parse error] {entry.custom_id}: {e}")
+                continue
+            parsed_by_id[entry.custom_id] = parsed
+            _cache_notes_parse(_notes_parse_cache_key(notes_by_id[entry.custom_id]), parsed)
+
+        with _sessions_lock:
+            records = []
+            for session_id, parsed in parsed_by_id.items():
+                session = _get_session(session_id)
+                # Skip sessions deleted or edited while the batch was running
+                if session is not None and session.get("notes") == notes_by_id[session_id]:
+                    records.append(dict(session, ai_parsed=parsed))
+            if records:
+                _append_session_records(records)
+        print(f"[AI batch] {batch_id}: updated {len(records)} sessions")
+    except Exception as e:
+        print(f"[AI batch error] {batch_id}: {e}")
+    finally:
+        with _notes_batch_lock:
+            _notes_batch["id"] = None
+
 
 # ---------------------------------------------------------------------------
 # API Routes
@@ -468,21 +1061,62 @@ def _parse_notes_with_claude(notes):
 @_auth_required
 def get_sessions():
     """Return all sessions sorted newest first."""
-    sessions = _read_sessions()
-    sessions.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-    return jsonify(sessions)
+    with _sessions_lock:
+        version = _sessions_version()
+        etag = _sessions_etag("sessions", version)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        sessions = _read_sessions()
+    # The log is kept in creation order, so newest-first is just a reversal
+    sessions.reverse()
+    response = jsonify(sessions)
+    response.set_etag(etag)
+    response.last_modified = version[0] / 1e9  # log mtime (ns)
+    # Always revalidate: without this, browsers may heuristically reuse the
+    # list (based on Last-Modified) and miss a just-created or deleted session
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _sessions_etag(*parts):
+    """Strong ETag for a response derived only from the sessions log (plus any extra parts)."""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _not_modified(etag, weak=False):
+    """Return a 304 response if the client already has this ETag, else None."""
+    if request.if_none_match.contains_weak(etag) if weak else etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=weak)
+        return response
+    return None
 
 
-@app.route("/api/sessions", methods=["POST"])
-@_auth_required
-def create_session():
-    """
-    Create a new session. If the notes field has more than 20 characters,
-    automatically parse them with Claude AI and attach the insights.
-    """
-    data = request.get_json()
+def _round_summary_strings(s):
+    """Return the (course info, score) strings used for a round in the coaching summary."""
+    course_info = s.get('course', '?')
+    if s.get('course_par'):
+        course_info += f" (Par {s['course_par']}"
+        if s.get('tee_slope'):
+            course_info += f", Slope {s['tee_slope']}"
+        if s.get('tee_rating'):
+            course_info += f", Rating {s['tee_rating']}"
+        if s.get('tee_yardage'):
+            course_info += f", {s['tee_yardage']}yds"
+        course_info += ")"
+    score_str = str(s.get('score', '?'))
+    if s.get('score_to_par') is not None:
+        stp = s['score_to_par']
+        score_str += f" ({'+' if stp >= 0 else ''}{stp} vs par)"
+    return course_info, score_str
+
+
+def _build_session(data):
+    """Build a session record from a request payload (missing fields get defaults)."""
     session = {
-        "id": str(uuid.uuid4()),
+        "id": uuid.uuid4().hex,
         "date": data.get("date", datetime.now().strftime("%Y-%m-%d")),
         "type": data.get("type", "range"),
         "intention": data.get("intention", ""),
@@ -516,233 +1150,402 @@ def create_session():
         "ai_parsed": data.get("ai_parsed"),
         "created_at": datetime.now().isoformat(),
     }
+    return session
 
-    # Auto-parse notes with Claude if long enough and not already parsed
+
+def _queue_notes_parse(session):
+    """Parse notes with Claude in the background if long enough and not already parsed."""
     if len(session.get("notes", "")) > 20 and not session.get("ai_parsed"):
-        parsed = _parse_notes_with_claude(session["notes"])
-        if parsed:
-            session["ai_parsed"] = parsed
+        _background_executor.submit(_parse_session_notes_in_background, session["id"], session["notes"])
 
-    sessions = _read_sessions()
-    sessions.append(session)
-    _write_sessions(sessions)
 
+@app.route("/api/sessions", methods=["POST"])
+@_auth_required
+def create_session():
+    """
+    Create a new session. If the notes field has more than 20 characters,
+    they are parsed with Claude AI in the background and the insights are
+    attached to the stored session once ready (the response doesn't wait).
+    """
+    session = _build_session(request.get_json())
+    _append_session_records([session])
+    _queue_notes_parse(session)
     return jsonify(session), 201
 
 
+@app.route("/api/sessions/bulk", methods=["POST"])
+@_auth_required
+def create_sessions_bulk():
+    """
+    Create many sessions from a JSON array in one request (e.g. an import).
+    All sessions are appended to the log in a single write; their notes are
+    parsed with Claude in parallel in the background, as for single creates.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list) or not all(isinstance(d, dict) for d in data):
+        return jsonify({"error": "Expected a JSON array of session objects"}), 400
+
+    sessions = [_build_session(d) for d in data]
+    _append_session_records(sessions)
+    for session in sessions:
+        _queue_notes_parse(session)
+    return jsonify(sessions), 201
+
+
+@app.route("/api/sessions/<session_id>/ai_parsed", methods=["GET"])
+@_auth_required
+def get_session_ai_parsed(session_id):
+    """
+    Return a session's AI-parsed insights, for clients polling after a create
+    (notes are parsed in the background, so this is null until Claude is done).
+    """
+    session = _get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+    return jsonify({"id": session_id, "ai_parsed": session.get("ai_parsed")})
+
+
+@app.route("/api/sessions/reparse_all", methods=["POST"])
+@_auth_required
+def reparse_all_sessions():
+    """
+    Re-parse stored session notes with Claude as one Message Batch, for
+    history that was imported without insights or parsed by an older prompt.
+    By default only sessions without insights are sent; ?force=1 sends every
+    session with notes. Returns 202 at once — batches can take minutes, and
+    the insights show up on the sessions as soon as the batch finishes. Only
+    one batch runs at a time: while it does, this returns 409 and its id.
+    """
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        return jsonify({"error": "ANTHROPIC_API_KEY is not set"}), 503
+
+    force = request.args.get("force") == "1"
+    # Held while submitting, so concurrent requests can't start two paid batches
+    with _notes_batch_lock:
+        if _notes_batch["id"] is not None:
+            return jsonify({"error": "A re-parse batch is already running", "batch_id": _notes_batch["id"]}), 409
+        session_notes = [
+            (s["id"], s["notes"])
+            for s in _read_sessions()
+            if len(s.get("notes", "")) > 20 and (force or not s.get("ai_parsed"))
+        ]
+        if not session_notes:
+            return jsonify({"queued": 0, "batch_id": None}), 202
+        try:
+            batch_id = _start_notes_batch(session_notes)
+        except Exception as e:
+            print(f"[AI batch error] {e}")
+            return jsonify({"error": f"Could not start the re-parse batch: {e}"}), 502
+    return jsonify({"queued": len(session_notes), "batch_id": batch_id}), 202
+
+
 @app.route("/api/sessions/<session_id>", methods=["DELETE"])
 @_auth_required
 def delete_session(session_id):
-    """Delete a session by its ID."""
-    sessions = _read_sessions()
-    sessions = [s for s in sessions if s["id"] != session_id]
-    _write_sessions(sessions)
+    """Delete a session by its ID (appends a tombstone to the sessions log)."""
+    _append_session_records([{"_deleted": session_id}])
+    _compact_sessions_log_if_needed()
     return jsonify({"deleted": session_id})
 
 
 # ── Stats ──────────────────────────────────────────────────────────────────
 
 
+# Stats for a player with no sessions yet (weekly_counts is filled in per day)
+_EMPTY_STATS = {
+    "total_sessions": 0,
+    "range_sessions": 0,
+    "rounds_played": 0,
+    "avg_feel": 0,
+    "streak": 0,
+    "total_balls": 0,
+    "best_score": None,
+    "latest_score": None,
+    "feel_trend": [],
+    "focus_distribution": [],
+    "score_trend": [],
+    "recurring_issues": [],
+    "avg_fir": None,
+    "avg_fir_pct": None,
+    "avg_gir": None,
+    "avg_gir_pct": None,
+    "avg_putts": None,
+    "avg_penalties": None,
+    "scrambling_pct": None,
+    "fir_trend": [],
+    "gir_trend": [],
+    "putts_trend": [],
+    "confidence_trend": [],
+    "best_vs_par": None,
+    "course_stats": [],
+}
+
+
+def _weekly_counts(session_dates, today):
+    """Practice frequency for the last 8 weeks (Monday-start), bucketed in one pass."""
+    first_week_start = today - timedelta(days=today.weekday() + 7 * 7)
+    week_buckets = [0] * 8
+    for d in session_dates:
+        week_index = (d - first_week_start).days // 7
+        if 0 <= week_index < 8:
+            week_buckets[week_index] += 1
+    weekly_counts = []
+    for i, count in enumerate(week_buckets):
+        label = (first_week_start + timedelta(weeks=i)).strftime("%b %d")
+        weekly_counts.append({"week": label, "sessions": count})
+    return weekly_counts
+
+
+def _cache_stats_response(cache_key, payload, etag):
+    """Encode (and gzip) a stats payload once and keep the bytes for repeat requests."""
+    body = jsonify(payload).get_data()
+    entry = _stats_cache["entry"] = (cache_key, body, gzip.compress(body, compresslevel=6))
+    return _stats_response(entry, etag)
+
+
+def _stats_response(entry, etag):
+    """
+    Build the /api/stats response from a cache entry, gzipped when the client
+    accepts it. The ETag is weak since it covers both encodings of the body.
+    """
+    _cache_key, body, gzipped = entry
+    if request.accept_encodings["gzip"]:
+        response = app.response_class(gzipped, mimetype="application/json")
+        response.content_encoding = "gzip"
+    else:
+        response = app.response_class(body, mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag, weak=True)
+    return _stats_cache_control(response)
+
+
+def _stats_cache_control(response):
+    """
+    Let the browser reuse /api/stats for a short while without asking (e.g.
+    switching tabs back to the dashboard); after that it revalidates the ETag.
+    """
+    response.cache_control.private = True
+    response.cache_control.max_age = STATS_BROWSER_MAX_AGE_SECONDS
+    return response
+
+
 @app.route("/api/stats", methods=["GET"])
 @_auth_required
 def get_stats():
     """
     Compute and return aggregate stats: totals, averages, streaks,
-    distributions, and trend data for charts.
+    distributions, and trend data for charts. All per-session metrics are
+    accumulated in a single pass over the date-sorted sessions. The result
+    is reused until the sessions change or the date rolls over.
     """
-    sessions = _read_sessions()
+    # One clock read per request: the cache key, streak and weekly buckets
+    # must all agree on what "today" is
+    today = datetime.now().date()
+    with _sessions_lock:
+        cache_key = (_sessions_version(), today)
+        sessions = _read_sessions()
+    etag = _sessions_etag("stats", *cache_key)
+    not_modified = _not_modified(etag, weak=True)
+    if not_modified is not None:
+        # Same Vary as the 200 it validates: the body depends on Accept-Encoding
+        not_modified.vary.add("Accept-Encoding")
+        return _stats_cache_control(not_modified)
+    entry = _stats_cache["entry"]
+    if entry is not None and entry[0] == cache_key:
+        return _stats_response(entry, etag)
+    if not sessions:
+        payload = dict(_EMPTY_STATS, weekly_counts=_weekly_counts([], today))
+        return _cache_stats_response(cache_key, payload, etag)
+
     sessions.sort(key=lambda s: s.get("date", ""))
 
     total = len(sessions)
-    range_sessions = [s for s in sessions if s["type"] == "range"]
-    rounds = [s for s in sessions if s["type"] == "round"]
+    range_count = 0
+    round_count = 0
+
+    feel_sum = feel_n = 0
+    total_balls = 0
+    scores = []
+    session_dates = []
+    feel_trend = deque(maxlen=20)
+    confidence_trend = deque(maxlen=20)
+    area_counter = Counter()
+    score_trend = []
+    best_vs_par = None
+    course_stats = defaultdict(lambda: [0, 0, math.inf])  # course -> [rounds, total_score, best]
+    fir_sum = fir_n = 0
+    gir_sum = gir_n = 0
+    putts_sum = putts_n = 0
+    penalties_sum = penalties_n = 0
+    scramble_rounds = 0
+    scramble_opportunities = scramble_made = 0
+    fir_trend = []
+    gir_trend = []
+    putts_trend = []
+    unique_issues = {}  # lowercased issue -> first spelling seen
+
+    for s in sessions:
+        # Parse each session date once (sessions are sorted, so this is too)
+        if s.get("date"):
+            session_dates.append(date.fromisoformat(s["date"]))
+
+        feel = s.get("feel_rating")
+        if feel:
+            feel_sum += feel
+            feel_n += 1
+            # Feel trend (last 20 sessions with feel_rating)
+            feel_trend.append({"date": s["date"], "rating": feel})
 
-    # Feel ratings
-    feel_ratings = [s["feel_rating"] for s in sessions if s.get("feel_rating")]
-    avg_feel = round(sum(feel_ratings) / len(feel_ratings), 1) if feel_ratings else 0
+        total_balls += s.get("ball_count") or 0
 
-    # Ball count
-    total_balls = sum(s.get("ball_count") or 0 for s in sessions)
+        # Confidence trend (last 20 sessions with confidence data)
+        if s.get("confidence"):
+            trend_point = {"date": s["date"]}
+            trend_point.update(s["confidence"])
+            confidence_trend.append(trend_point)
+
+        # Recurring themes (issues from ai_parsed), de-duplicated
+        # case-insensitively as we go (first spelling wins)
+        if s.get("ai_parsed") and s["ai_parsed"].get("issues"):
+            for issue in s["ai_parsed"]["issues"]:
+                unique_issues.setdefault(issue.lower(), issue)
 
-    # Scores
-    scores = [s["score"] for s in rounds if s.get("score")]
+        if s["type"] == "range":
+            range_count += 1
+            # Practice focus distribution
+            area_counter.update(s.get("areas", []))
+            continue
+        if s["type"] != "round":
+            continue
+        round_count += 1
+
+        score = s.get("score")
+        par = s.get("course_par")
+        if score:
+            scores.append(score)
+            # Score trend (include par info when available)
+            trend_point = {"date": s["date"], "score": score}
+            if par:
+                trend_point["par"] = par
+                trend_point["vs_par"] = score - par
+                if best_vs_par is None or score - par < best_vs_par:
+                    best_vs_par = score - par
+            score_trend.append(trend_point)
+
+            # Stats by course
+            if s.get("course"):
+                cs = course_stats[s["course"]]
+                cs[0] += 1
+                cs[1] += score
+                if score < cs[2]:
+                    cs[2] = score
+
+        # ── Enhanced round stats ──────────────────────────────────────────
+        fir = s.get("fairways_hit")
+        if fir is not None:
+            fir_sum += fir
+            fir_n += 1
+            fir_trend.append({"date": s["date"], "fir": fir})
+
+        gir = s.get("greens_in_regulation")
+        if gir is not None:
+            gir_sum += gir
+            gir_n += 1
+            gir_trend.append({"date": s["date"], "gir": gir})
+
+        putts = s.get("total_putts")
+        if putts is not None:
+            putts_sum += putts
+            putts_n += 1
+            putts_trend.append({"date": s["date"], "putts": putts})
+
+        if s.get("penalties") is not None:
+            penalties_sum += s["penalties"]
+            penalties_n += 1
+
+        # Scrambling: up_and_downs / (18 - GIR) for rounds with both
+        if s.get("up_and_downs") is not None and gir is not None:
+            scramble_rounds += 1
+            scramble_opportunities += max(18 - (gir or 0), 0)
+            scramble_made += s["up_and_downs"]
+
+    avg_feel = round(feel_sum / feel_n, 1) if feel_n else 0
     best_score = min(scores) if scores else None
     latest_score = scores[-1] if scores else None
 
     # Day streak (consecutive days ending at today or most recent session)
-    unique_dates = sorted(set(s["date"] for s in sessions if s.get("date")))
     streak = 0
-    if unique_dates:
-        check_date = datetime.now().date()
-        most_recent = datetime.strptime(unique_dates[-1], "%Y-%m-%d").date()
-        if most_recent < check_date:
-            check_date = most_recent
-        date_set = set(unique_dates)
-        while check_date.strftime("%Y-%m-%d") in date_set:
+    if session_dates:
+        # Walk back over day ordinals: plain int arithmetic and hashing, no
+        # timedelta/date object per step
+        day = min(today, session_dates[-1]).toordinal()
+        ordinals = {d.toordinal() for d in session_dates}
+        while day in ordinals:
             streak += 1
-            check_date -= timedelta(days=1)
-
-    # Weekly practice frequency (last 8 weeks)
-    today = datetime.now().date()
-    weekly_counts = []
-    for i in range(7, -1, -1):
-        week_start = today - timedelta(days=today.weekday() + 7 * i)
-        week_end = week_start + timedelta(days=6)
-        count = sum(
-            1
-            for s in sessions
-            if s.get("date")
-            and week_start <= datetime.strptime(s["date"], "%Y-%m-%d").date() <= week_end
-        )
-        label = week_start.strftime("%b %d")
-        weekly_counts.append({"week": label, "sessions": count})
+            day -= 1
 
-    # Feel trend (last 20 sessions with feel_rating)
-    feel_trend = []
-    sessions_with_feel = [s for s in sessions if s.get("feel_rating")]
-    for s in sessions_with_feel[-20:]:
-        feel_trend.append({"date": s["date"], "rating": s["feel_rating"]})
+    weekly_counts = _weekly_counts(session_dates, today)
 
-    # Practice focus distribution
-    area_counter = Counter()
-    for s in range_sessions:
-        for area in s.get("areas", []):
-            area_counter[area] += 1
     focus_distribution = [
         {"name": area, "value": count} for area, count in area_counter.most_common()
     ]
 
-    # Score trend (include par info when available)
-    score_trend = []
-    for s in rounds:
-        if s.get("score"):
-            entry = {"date": s["date"], "score": s["score"]}
-            if s.get("course_par"):
-                entry["par"] = s["course_par"]
-                entry["vs_par"] = s["score"] - s["course_par"]
-            score_trend.append(entry)
-
-    # Best score vs par
-    best_vs_par = None
-    rounds_with_par = [s for s in rounds if s.get("score") and s.get("course_par")]
-    if rounds_with_par:
-        best_vs_par = min(s["score"] - s["course_par"] for s in rounds_with_par)
-
-    # Stats by course
-    course_stats = {}
-    for s in rounds:
-        if s.get("course") and s.get("score"):
-            cname = s["course"]
-            if cname not in course_stats:
-                course_stats[cname] = {"rounds": 0, "total_score": 0, "best": None}
-            course_stats[cname]["rounds"] += 1
-            course_stats[cname]["total_score"] += s["score"]
-            if course_stats[cname]["best"] is None or s["score"] < course_stats[cname]["best"]:
-                course_stats[cname]["best"] = s["score"]
-    for cname in course_stats:
-        cs = course_stats[cname]
-        cs["avg_score"] = round(cs["total_score"] / cs["rounds"], 1)
-    course_stats_list = [
-        {"course": k, **v} for k, v in sorted(course_stats.items(), key=lambda x: -x[1]["rounds"])
-    ]
-
-    # ── Enhanced round stats ──────────────────────────────────────────────
+    course_stats_list = sorted(
+        (
+            {
+                "course": cname,
+                "rounds": n_rounds,
+                "total_score": total_score,
+                "best": best,
+                "avg_score": round(total_score / n_rounds, 1),
+            }
+            for cname, (n_rounds, total_score, best) in course_stats.items()
+        ),
+        key=itemgetter("rounds"),
+        reverse=True,
+    )
 
-    # FIR stats
-    rounds_with_fir = [s for s in rounds if s.get("fairways_hit") is not None]
-    avg_fir = round(sum(s["fairways_hit"] for s in rounds_with_fir) / len(rounds_with_fir), 1) if rounds_with_fir else None
+    avg_fir = round(fir_sum / fir_n, 1) if fir_n else None
     avg_fir_pct = round((avg_fir / 14) * 100, 1) if avg_fir is not None else None
-
-    # GIR stats
-    rounds_with_gir = [s for s in rounds if s.get("greens_in_regulation") is not None]
-    avg_gir = round(sum(s["greens_in_regulation"] for s in rounds_with_gir) / len(rounds_with_gir), 1) if rounds_with_gir else None
+    avg_gir = round(gir_sum / gir_n, 1) if gir_n else None
     avg_gir_pct = round((avg_gir / 18) * 100, 1) if avg_gir is not None else None
+    avg_putts = round(putts_sum / putts_n, 1) if putts_n else None
+    avg_penalties = round(penalties_sum / penalties_n, 1) if penalties_n else None
 
-    # Putts stats
-    rounds_with_putts = [s for s in rounds if s.get("total_putts") is not None]
-    avg_putts = round(sum(s["total_putts"] for s in rounds_with_putts) / len(rounds_with_putts), 1) if rounds_with_putts else None
-
-    # Penalties stats
-    rounds_with_penalties = [s for s in rounds if s.get("penalties") is not None]
-    avg_penalties = round(sum(s["penalties"] for s in rounds_with_penalties) / len(rounds_with_penalties), 1) if rounds_with_penalties else None
-
-    # Scrambling percentage: up_and_downs / (18 - GIR) for rounds with both
     scrambling_pct = None
-    scramble_rounds = [s for s in rounds if s.get("up_and_downs") is not None and s.get("greens_in_regulation") is not None]
-    if scramble_rounds:
-        total_opportunities = sum(max(18 - (s["greens_in_regulation"] or 0), 0) for s in scramble_rounds)
-        total_made = sum(s["up_and_downs"] for s in scramble_rounds)
-        if total_opportunities > 0:
-            scrambling_pct = round((total_made / total_opportunities) * 100, 1)
-
-    # FIR / GIR / Putts trend charts
-    fir_trend = []
-    for s in rounds:
-        if s.get("fairways_hit") is not None:
-            fir_trend.append({"date": s["date"], "fir": s["fairways_hit"]})
-
-    gir_trend = []
-    for s in rounds:
-        if s.get("greens_in_regulation") is not None:
-            gir_trend.append({"date": s["date"], "gir": s["greens_in_regulation"]})
-
-    putts_trend = []
-    for s in rounds:
-        if s.get("total_putts") is not None:
-            putts_trend.append({"date": s["date"], "putts": s["total_putts"]})
-
-    # Confidence trend (last 20 sessions with confidence data)
-    confidence_trend = []
-    sessions_with_conf = [s for s in sessions if s.get("confidence")]
-    for s in sessions_with_conf[-20:]:
-        entry = {"date": s["date"]}
-        entry.update(s["confidence"])
-        confidence_trend.append(entry)
-
-    # Recurring themes (issues from ai_parsed)
-    issues = []
-    for s in sessions:
-        if s.get("ai_parsed") and s["ai_parsed"].get("issues"):
-            issues.extend(s["ai_parsed"]["issues"])
-    seen = set()
-    unique_issues = []
-    for issue in issues:
-        lower = issue.lower()
-        if lower not in seen:
-            seen.add(lower)
-            unique_issues.append(issue)
-
-    return jsonify(
-        {
-            "total_sessions": total,
-            "range_sessions": len(range_sessions),
-            "rounds_played": len(rounds),
-            "avg_feel": avg_feel,
-            "streak": streak,
-            "total_balls": total_balls,
-            "best_score": best_score,
-            "latest_score": latest_score,
-            "weekly_counts": weekly_counts,
-            "feel_trend": feel_trend,
-            "focus_distribution": focus_distribution,
-            "score_trend": score_trend,
-            "recurring_issues": unique_issues,
-            # Enhanced round stats
-            "avg_fir": avg_fir,
-            "avg_fir_pct": avg_fir_pct,
-            "avg_gir": avg_gir,
-            "avg_gir_pct": avg_gir_pct,
-            "avg_putts": avg_putts,
-            "avg_penalties": avg_penalties,
-            "scrambling_pct": scrambling_pct,
-            "fir_trend": fir_trend,
-            "gir_trend": gir_trend,
-            "putts_trend": putts_trend,
-            "confidence_trend": confidence_trend,
-            "best_vs_par": best_vs_par,
-            "course_stats": course_stats_list,
-        }
-    )
+    if scramble_rounds and scramble_opportunities > 0:
+        scrambling_pct = round((scramble_made / scramble_opportunities) * 100, 1)
+
+    payload = {
+        "total_sessions": total,
+        "range_sessions": range_count,
+        "rounds_played": round_count,
+        "avg_feel": avg_feel,
+        "streak": streak,
+        "total_balls": total_balls,
+        "best_score": best_score,
+        "latest_score": latest_score,
+        "weekly_counts": weekly_counts,
+        "feel_trend": list(feel_trend),
+        "focus_distribution": focus_distribution,
+        "score_trend": score_trend,
+        "recurring_issues": list(unique_issues.values()),
+        # Enhanced round stats
+        "avg_fir": avg_fir,
+        "avg_fir_pct": avg_fir_pct,
+        "avg_gir": avg_gir,
+        "avg_gir_pct": avg_gir_pct,
+        "avg_putts": avg_putts,
+        "avg_penalties": avg_penalties,
+        "scrambling_pct": scrambling_pct,
+        "fir_trend": fir_trend,
+        "gir_trend": gir_trend,
+        "putts_trend": putts_trend,
+        "confidence_trend": list(confidence_trend),
+        "best_vs_par": best_vs_par,
+        "course_stats": course_stats_list,
+    }
+    return _cache_stats_response(cache_key, payload, etag)
 
 
 # ── Course API ─────────────────────────────────────────────────────────────
@@ -765,17 +1568,16 @@ def search_courses():
 
     # Check in-memory search cache (5 min TTL)
     cache_key = query.lower()
-    if cache_key in _search_cache:
-        entry = _search_cache[cache_key]
-        if time.time() - entry["ts"] < 300:
-            return jsonify(entry["results"])
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        return jsonify(cached)
 
     try:
-        resp = requests.get(
+        resp = _golf_http.get(
             f"{GOLF_COURSE_API_URL}/v1/search",
             headers=_golf_api_headers(),
             params={"search_query": query},
-            timeout=10,
+            timeout=GOLF_COURSE_API_TIMEOUT,
         )
         print(f"[Course search] query='{query}' status={resp.status_code}")
         if resp.status_code != 200:
@@ -804,7 +1606,7 @@ def search_courses():
                 "holes": c.get("holes", 18),
             })
 
-        _search_cache[cache_key] = {"results": courses, "ts": time.time()}
+        _set_cached_search(cache_key, courses)
         return jsonify(courses)
 
     except Exception as e:
@@ -812,6 +1614,21 @@ def search_courses():
         return jsonify([])
 
 
+# Every tee in a course-details response carries all of these keys, so the
+# merge code (and the frontend) can index them directly
+_EMPTY_TEE = {
+    "name": None,
+    "color": None,
+    "total_yardage": None,
+    "front_yardage": None,
+    "back_yardage": None,
+    "hole_yardages": None,
+    "slope": None,
+    "rating": None,
+    "par": None,
+}
+
+
 @app.route("/api/courses/<course_id>", methods=["GET"])
 @_auth_required
 def get_course_details(course_id):
@@ -832,10 +1649,10 @@ def get_course_details(course_id):
         return jsonify({"error": "GOLF_COURSE_API_KEY is not set"}), 200
 
     try:
-        resp = requests.get(
+        resp = _golf_http.get(
             f"{GOLF_COURSE_API_URL}/v1/courses/{course_id}",
             headers=_golf_api_headers(),
-            timeout=10,
+            timeout=GOLF_COURSE_API_TIMEOUT,
         )
         if resp.status_code != 200:
             return jsonify({"error": f"API returned {resp.status_code}"}), 200
@@ -886,25 +1703,37 @@ def get_course_details(course_id):
                 if key in final_tees:
                     continue  # Already have this tee from male section
 
-                # Extract per-hole data from the tee's "holes" array
+                # Extract per-hole data from the tee's "holes" array, folding
+                # front/back totals and presence flags in as we go
                 holes_arr = t.get("holes", [])
                 hole_yardages = []
                 hole_pars = []
                 hole_handicaps = []
-
-                for h in holes_arr:
-                    hole_yardages.append(h.get("yardage", 0))
-                    hole_pars.append(h.get("par", 0))
-                    hole_handicaps.append(h.get("handicap"))
-
-                total_yards = t.get("total_yards") or sum(hole_yardages)
+                front_yds = back_yds = par_front = par_back = 0
+                has_par = has_handicap = False
+
+                for i, h in enumerate(holes_arr):
+                    yards = h.get("yardage", 0)
+                    par = h.get("par", 0)
+                    handicap = h.get("handicap")
+                    hole_yardages.append(yards)
+                    hole_pars.append(par)
+                    hole_handicaps.append(handicap)
+                    if i < 9:
+                        front_yds += yards
+                        par_front += par
+                    else:
+                        back_yds += yards
+                        par_back += par
+                    if par > 0:
+                        has_par = True
+                    if handicap is not None:
+                        has_handicap = True
+
+                total_yards = t.get("total_yards") or (front_yds + back_yds)
                 n_holes = t.get("number_of_holes") or len(holes_arr) or 18
                 num_holes = n_holes
 
-                # Compute front/back yardages
-                front_yds = sum(hole_yardages[:9]) if len(hole_yardages) >= 9 else sum(hole_yardages)
-                back_yds = sum(hole_yardages[9:]) if len(hole_yardages) > 9 else 0
-
                 # Get slope and rating — try multiple field names
                 slope = t.get("slope_rating") or t.get("slope")
                 rating = t.get("course_rating") or t.get("rating")
@@ -922,9 +1751,7 @@ def get_course_details(course_id):
                 }
 
                 # Build par data from the first tee that has hole data
-                if par_data is None and hole_pars and any(p > 0 for p in hole_pars):
-                    par_front = sum(hole_pars[:9]) if len(hole_pars) >= 9 else sum(hole_pars)
-                    par_back = sum(hole_pars[9:]) if len(hole_pars) > 9 else 0
+                if par_data is None and has_par:
                     par_total = t.get("par_total") or (par_front + par_back)
                     par_data = {
                         "total": par_total,
@@ -935,7 +1762,7 @@ def get_course_details(course_id):
                     course_par = par_total
 
                 # Build handicap data from the first tee
-                if handicap_data is None and hole_handicaps and any(h is not None for h in hole_handicaps):
+                if handicap_data is None and has_handicap:
                     handicap_data = hole_handicaps
 
                 # Set course_par from any tee if not set yet
@@ -944,47 +1771,49 @@ def get_course_details(course_id):
 
         # Layer on teeBoxes slope/rating
         for key, tb in tee_box_info.items():
-            if key in final_tees:
-                if tb.get("slope") and not final_tees[key].get("slope"):
-                    final_tees[key]["slope"] = tb["slope"]
-                if tb.get("rating") and not final_tees[key].get("rating"):
-                    final_tees[key]["rating"] = tb["rating"]
+            tee = final_tees.get(key)
+            if tee is not None:
+                if tb["slope"] and not tee["slope"]:
+                    tee["slope"] = tb["slope"]
+                if tb["rating"] and not tee["rating"]:
+                    tee["rating"] = tb["rating"]
 
         # --- Also try parsing a separate scorecard field if it exists ---
+        # The parse is shared, so only the pieces still missing get copied in
         scorecard_data = _parse_scorecard(course_obj.get("scorecard"))
         if scorecard_data:
             # Use scorecard par if we don't have it yet
             if par_data is None:
-                par_data = scorecard_data["par"]
+                par_data = copy.deepcopy(scorecard_data["par"])
                 course_par = par_data.get("total")
-            if handicap_data is None:
-                handicap_data = scorecard_data["handicap"]
+            if handicap_data is None and scorecard_data["handicap"] is not None:
+                handicap_data = list(scorecard_data["handicap"])
 
             # Merge scorecard tee yardages
             for tee_name, yard_data in scorecard_data["tee_yardages"].items():
                 key = tee_name.lower()
-                if key in final_tees:
+                tee = final_tees.get(key)
+                if tee is not None:
                     # Enrich existing tee with hole-by-hole data if missing
-                    if not final_tees[key].get("hole_yardages"):
-                        final_tees[key]["hole_yardages"] = yard_data["hole_yardages"]
-                        final_tees[key]["front_yardage"] = yard_data["front_yardage"]
-                        final_tees[key]["back_yardage"] = yard_data["back_yardage"]
+                    if not tee["hole_yardages"]:
+                        tee["hole_yardages"] = list(yard_data["hole_yardages"])
+                        tee["front_yardage"] = yard_data["front_yardage"]
+                        tee["back_yardage"] = yard_data["back_yardage"]
                 else:
                     final_tees[key] = {
+                        **_EMPTY_TEE,
                         "name": tee_name,
                         "color": _guess_tee_color(tee_name),
                         "total_yardage": yard_data["total_yardage"],
                         "front_yardage": yard_data["front_yardage"],
                         "back_yardage": yard_data["back_yardage"],
-                        "hole_yardages": yard_data["hole_yardages"],
-                        "slope": None,
-                        "rating": None,
+                        "hole_yardages": list(yard_data["hole_yardages"]),
                     }
 
         # Convert to list, sorted by yardage (longest first)
         tees_list = sorted(
             final_tees.values(),
-            key=lambda t: t.get("total_yardage") or 0,
+            key=lambda t: t["total_yardage"] or 0,
             reverse=True,
         )
 
@@ -1021,57 +1850,61 @@ def _merge_custom_tees(course_id, course_data):
         return course_data
 
     custom_tees = custom[key].get("tees", [])
-    existing_names = {t.get("name", "").lower() for t in course_data.get("tees", [])}
+    tees = course_data.setdefault("tees", [])
+    # Index by lowercase name; the first tee wins on duplicate names
+    by_name = {}
+    for t in tees:
+        by_name.setdefault(t.get("name", "").lower(), t)
 
+    # custom_tees.json is user-editable, so its fields may be missing
     for ct in custom_tees:
-        ct_name = ct.get("name", "").lower()
-        if ct_name in existing_names:
+        t = by_name.get(ct.get("name", "").lower())
+        if t is not None:
             # Update slope/rating on existing tee
-            for t in course_data.get("tees", []):
-                if t.get("name", "").lower() == ct_name:
-                    if ct.get("slope") and not t.get("slope"):
-                        t["slope"] = ct["slope"]
-                    if ct.get("rating") and not t.get("rating"):
-                        t["rating"] = ct["rating"]
-                    if ct.get("yardage") and not t.get("total_yardage"):
-                        t["total_yardage"] = ct["yardage"]
-                    break
+            if ct.get("slope") and not t.get("slope"):
+                t["slope"] = ct["slope"]
+            if ct.get("rating") and not t.get("rating"):
+                t["rating"] = ct["rating"]
+            if ct.get("yardage") and not t.get("total_yardage"):
+                t["total_yardage"] = ct["yardage"]
         else:
             # Add new custom tee
-            course_data.setdefault("tees", []).append({
+            tees.append({
+                **_EMPTY_TEE,
                 "name": ct["name"],
                 "color": _guess_tee_color(ct["name"]),
                 "total_yardage": ct.get("yardage"),
                 "slope": ct.get("slope"),
                 "rating": ct.get("rating"),
-                "front_yardage": None,
-                "back_yardage": None,
-                "hole_yardages": None,
                 "added_by_user": True,
             })
 
     return course_data
 
 
+# Tee-name keywords in priority order: when a name contains several, the
+# earliest entry here wins (e.g. "Blue/White" -> blue)
+_TEE_COLOR_KEYWORDS = (
+    ("black", "black"), ("blue", "blue"), ("white", "white"), ("gold", "gold"),
+    ("red", "red"), ("green", "green"), ("silver", "silver"), ("yellow", "gold"),
+    ("champ", "black"), ("tips", "black"), ("back", "blue"), ("middle", "white"),
+    ("senior", "red"), ("forward", "red"), ("ladies", "red"),
+    ("bronze", "gold"), ("copper", "gold"),
+)
+_TEE_COLOR_BY_KEYWORD = dict(_TEE_COLOR_KEYWORDS)
+_TEE_KEYWORD_PRIORITY = {kw: i for i, (kw, _) in enumerate(_TEE_COLOR_KEYWORDS)}
+# One scan finds every keyword; the lookahead also catches overlapping ones
+# (e.g. "red" inside "silvered")
+_TEE_KEYWORD_RE = re.compile("(?=(" + "|".join(kw for kw, _ in _TEE_COLOR_KEYWORDS) + "))")
+
+
+@lru_cache(maxsize=512)
 def _guess_tee_color(tee_name):
     """Map a tee name to a standard color string for frontend display."""
-    name = tee_name.lower()
-    for color in ["black", "blue", "white", "gold", "red", "green", "silver", "yellow"]:
-        if color in name:
-            if color == "yellow":
-                return "gold"
-            return color
-    if "champ" in name or "tips" in name:
-        return "black"
-    if "back" in name:
-        return "blue"
-    if "middle" in name:
-        return "white"
-    if "senior" in name or "forward" in name or "ladies" in name:
-        return "red"
-    if "bronze" in name or "copper" in name:
-        return "gold"
-    return "gray"
+    hits = _TEE_KEYWORD_RE.findall(tee_name.lower())
+    if not hits:
+        return "gray"
+    return _TEE_COLOR_BY_KEYWORD[min(hits, key=_TEE_KEYWORD_PRIORITY.__getitem__)]
 
 
 @app.route("/api/courses/<course_id>/raw", methods=["GET"])
@@ -1081,13 +1914,19 @@ def get_course_raw(course_id):
     api_key = os.environ.get("GOLF_COURSE_API_KEY", "")
     if not api_key:
         return jsonify({"error": "GOLF_COURSE_API_KEY is not set"}), 200
+    cached = _get_cached_raw_course(course_id)
+    if cached is not None:
+        return jsonify(cached)
     try:
-        resp = requests.get(
+        resp = _golf_http.get(
             f"{GOLF_COURSE_API_URL}/v1/courses/{course_id}",
             headers=_golf_api_headers(),
-            timeout=10,
+            timeout=GOLF_COURSE_API_TIMEOUT,
         )
-        return jsonify(resp.json())
+        data = resp.json()
+        if resp.status_code == 200:
+            _set_cached_raw_course(course_id, data)
+        return jsonify(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 200
 
@@ -1115,9 +1954,13 @@ def save_custom_tee(course_id):
     }
 
     existing = custom[key]["tees"]
+    name_lc = data["name"].lower()
     found = False
     for i, t in enumerate(existing):
-        if t.get("name", "").lower() == data["name"].lower():
+        if t.get("name", "").lower() == name_lc:
+            if t == tee_entry:
+                # Re-saving identical data: nothing to write or invalidate
+                return jsonify({"saved": True, "tee": tee_entry})
             existing[i] = tee_entry
             found = True
             break
@@ -1127,10 +1970,7 @@ def save_custom_tee(course_id):
     _write_custom_tees(custom)
 
     # Invalidate the disk cache for this course so next fetch merges fresh
-    cache = _read_course_cache()
-    if key in cache:
-        del cache[key]
-        _write_course_cache(cache)
+    _invalidate_cached_course(course_id)
 
     return jsonify({"saved": True, "tee": tee_entry})
 
@@ -1138,12 +1978,57 @@ def save_custom_tee(course_id):
 # ── Transcription ──────────────────────────────────────────────────────────
 
 
+def _get_whisper_model():
+    """
+    Load the Whisper model on first use and reuse it for later requests.
+    Prefers faster-whisper (CTranslate2: float16 on a CUDA GPU, int8 on CPU)
+    and falls back to openai-whisper, which picks the GPU and fp16 itself
+    when torch sees one. Raises ImportError if neither is installed.
+    """
+    global _whisper_model, _whisper_backend
+    if _whisper_model is None:
+        with _whisper_model_lock:
+            if _whisper_model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                    backend = "faster-whisper"
+                except ImportError:
+                    import whisper
+                    backend = "openai-whisper"
+                print(f"[Transcribe] Loading {backend} model '{WHISPER_MODEL}'")
+                if backend == "faster-whisper":
+                    import ctranslate2
+                    if ctranslate2.get_cuda_device_count() > 0:
+                        device, compute_type = "cuda", "float16"
+                    else:
+                        device, compute_type = "cpu", "int8"
+                    print(f"[Transcribe] Using {device} ({compute_type})")
+                    model = WhisperModel(WHISPER_MODEL, device=device, compute_type=compute_type)
+                else:
+                    model = whisper.load_model(WHISPER_MODEL)
+                _whisper_backend = backend
+                _whisper_model = model
+    return _whisper_model
+
+
+def _transcribe_samples(audio):
+    """Transcribe 16 kHz mono float32 samples with whichever Whisper backend is loaded."""
+    model = _get_whisper_model()
+    if _whisper_backend == "faster-whisper":
+        # Greedy decoding, as openai-whisper does by default (faster-whisper
+        # defaults to beam 5); the Silero VAD filter skips the silent stretches
+        # common in voice memos instead of running the decoder over them
+        segments, _info = model.transcribe(audio, beam_size=1, vad_filter=True)
+        return "".join(seg.text for seg in segments)
+    return model.transcribe(audio)["text"]
+
+
 @app.route("/api/transcribe", methods=["POST"])
 @_auth_required
 def transcribe_audio():
     """
-    Accept an audio file upload, convert it to WAV with ffmpeg,
-    transcribe with OpenAI Whisper (local), then parse the transcript
+    Accept an audio file upload, decode it with ffmpeg, transcribe
+    with Whisper (local), then parse the transcript
     with Claude to extract structured session data.
     """
     if "file" not in request.files:
@@ -1152,25 +2037,36 @@ def transcribe_audio():
     audio_file = request.files["file"]
 
     try:
-        import whisper
+        import numpy as np
     except ImportError:
+        np = None
+    if np is None or not (
+        importlib.util.find_spec("faster_whisper") or importlib.util.find_spec("whisper")
+    ):
         return jsonify(
-            {"error": "Whisper is not installed. Run: pip install openai-whisper"}
+            {"error": "Whisper is not installed. Run: pip install faster-whisper (or openai-whisper)"}
         ), 500
 
+    # The first transcription has to load the model — do that while ffmpeg
+    # decodes, on its own executor so it never queues behind note parses
+    model_ready = None
+    if _whisper_model is None:
+        model_ready = _whisper_load_executor.submit(_get_whisper_model)
+
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Save uploaded file
+        # Save uploaded file (m4a/mp4 need a seekable input, so not stdin)
         input_path = os.path.join(tmpdir, "input_audio" + os.path.splitext(audio_file.filename)[1])
         audio_file.save(input_path)
 
-        # Convert to WAV with ffmpeg
-        wav_path = os.path.join(tmpdir, "audio.wav")
+        # Decode to 16 kHz mono PCM on stdout — Whisper takes the samples
+        # directly, so there's no intermediate WAV for it to decode again
         try:
-            subprocess.run(
-                ["ffmpeg", "-i", input_path, "-ar", "16000", "-ac", "1", wav_path],
+            pcm = subprocess.run(
+                ["ffmpeg", "-nostdin", "-i", input_path,
+                 "-f", "s16le", "-ac", "1", "-ar", "16000", "pipe:1"],
                 check=True,
                 capture_output=True,
-            )
+            ).stdout
         except FileNotFoundError:
             return jsonify(
                 {"error": "ffmpeg is not installed. Please install ffmpeg."}
@@ -1178,17 +2074,18 @@ def transcribe_audio():
         except subprocess.CalledProcessError as e:
             return jsonify({"error": f"ffmpeg conversion failed: {e.stderr.decode()}"}), 500
 
-        # Transcribe with Whisper
-        model = whisper.load_model("base")
-        result = model.transcribe(wav_path)
-        transcript = result["text"]
+    # Transcribe with Whisper
+    if model_ready is not None:
+        model_ready.result()
+    audio = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    transcript = _transcribe_samples(audio)
 
     # Parse transcript with Claude
     parsed = None
     try:
         client = _get_claude_client()
         message = client.messages.create(
-            model=CLAUDE_MODEL,
+            model=CLAUDE_FAST_MODEL,
             max_tokens=1024,
             system=(
                 "You are a golf voice memo parser. The user recorded a voice memo about "
@@ -1233,11 +2130,46 @@ def transcribe_audio():
 # ── AI Coaching ────────────────────────────────────────────────────────────
 
 
+_COACHING_ADVICE_SYSTEM = (
+    "You are a supportive, knowledgeable golf coach analyzing a player's "
+    "practice and play history. You have access to their session data including "
+    "practice areas, round stats (FIR, GIR, putts, penalties, scrambling), feel "
+    "ratings, confidence levels across different parts of their game, pre-session "
+    "intentions, playing conditions, and equipment changes. Give specific, "
+    "actionable advice based on patterns you see. Compare their intentions to "
+    "their actual sessions — are they following through? Look at confidence "
+    "trends — where are they gaining or losing confidence? Analyze their round "
+    "stats to identify the biggest scoring opportunities (e.g., if they're losing "
+    "strokes to penalties or putting). Be encouraging but honest. Keep your "
+    "response to 3-4 short paragraphs. Use a conversational, coach-like tone. "
+    "Reference specific data points from their sessions."
+)
+
+_COACHING_SUMMARY_SYSTEM = (
+    "You are a golf analytics assistant providing a comprehensive game summary. "
+    "Analyze the player's data including: practice frequency and focus areas, "
+    "round scoring trends, fairways hit and greens in regulation percentages, "
+    "putting averages, penalty frequency, scrambling rate, confidence trends "
+    "across different game areas, how conditions affected their scores, and any "
+    "equipment changes. Provide a clear, data-driven summary organized around: "
+    "overall trajectory, strengths, areas for improvement, and notable patterns. "
+    "Keep it to 3-4 short paragraphs."
+)
+
+# One prompt that produces both of the above, for clients that want both
+_COACHING_BOTH_SYSTEM = (
+    "You will write two separate pieces for the same golf player based on their "
+    "practice and play history.\n\n"
+    "ADVICE: " + _COACHING_ADVICE_SYSTEM + "\n\n"
+    "SUMMARY: " + _COACHING_SUMMARY_SYSTEM + "\n\n"
+    'Return ONLY valid JSON with two string keys: "advice" and "summary".'
+)
+
+
 def _format_sessions_for_coaching(sessions, limit=30):
     """Format the most recent sessions as a text summary for the AI coach."""
-    sessions_sorted = sorted(
-        sessions, key=lambda s: s.get("created_at", ""), reverse=True
-    )[:limit]
+    # Sessions come from the log in creation order: the newest are at the end
+    sessions_sorted = sessions[:-limit - 1:-1]
 
     lines = []
     for s in sessions_sorted:
@@ -1257,54 +2189,41 @@ def _format_sessions_for_coaching(sessions, limit=30):
                 conf_str = f" | Confidence: {', '.join(parts)}"
 
         if s["type"] == "range":
-            line = (
+            line_parts = [
                 f"[Range] {s['date']} — Areas: {', '.join(s.get('areas', []))} | "
                 f"Balls: {s.get('ball_count', '?')} | Feel: {s.get('feel_rating', '?')}/5"
                 f"{intention}{conf_str}{equipment}"
-            )
+            ]
             if s.get("notes"):
-                line += f" | Notes: {s['notes'][:200]}"
+                line_parts.append(f" | Notes: {s['notes'][:200]}")
             if s.get("ai_parsed"):
                 ap = s["ai_parsed"]
                 if ap.get("positives"):
-                    line += f" | Positives: {', '.join(ap['positives'])}"
+                    line_parts.append(f" | Positives: {', '.join(ap['positives'])}")
                 if ap.get("issues"):
-                    line += f" | Issues: {', '.join(ap['issues'])}"
+                    line_parts.append(f" | Issues: {', '.join(ap['issues'])}")
         else:
-            course_info = s.get('course', '?')
-            if s.get('course_par'):
-                course_info += f" (Par {s['course_par']}"
-                if s.get('tee_slope'):
-                    course_info += f", Slope {s['tee_slope']}"
-                if s.get('tee_rating'):
-                    course_info += f", Rating {s['tee_rating']}"
-                if s.get('tee_yardage'):
-                    course_info += f", {s['tee_yardage']}yds"
-                course_info += ")"
-            score_str = str(s.get('score', '?'))
-            if s.get('score_to_par') is not None:
-                stp = s['score_to_par']
-                score_str += f" ({'+' if stp >= 0 else ''}{stp} vs par)"
-
-            line = (
+            course_info, score_str = _round_summary_strings(s)
+
+            line_parts = [
                 f"[Round] {s['date']} — Course: {course_info} | "
                 f"Score: {score_str} (F9: {s.get('front_nine', '?')}, "
                 f"B9: {s.get('back_nine', '?')}) | Feel: {s.get('feel_rating', '?')}/5"
                 f"{intention}{conf_str}{equipment}"
-            )
+            ]
             # Enhanced round stats
             if s.get("tees_played"):
-                line += f" | Tees: {s['tees_played']}"
+                line_parts.append(f" | Tees: {s['tees_played']}")
             if s.get("fairways_hit") is not None:
-                line += f" | FIR: {s['fairways_hit']}/14"
+                line_parts.append(f" | FIR: {s['fairways_hit']}/14")
             if s.get("greens_in_regulation") is not None:
-                line += f" | GIR: {s['greens_in_regulation']}/18"
+                line_parts.append(f" | GIR: {s['greens_in_regulation']}/18")
             if s.get("total_putts") is not None:
-                line += f" | Putts: {s['total_putts']}"
+                line_parts.append(f" | Putts: {s['total_putts']}")
             if s.get("penalties") is not None:
-                line += f" | Penalties: {s['penalties']}"
+                line_parts.append(f" | Penalties: {s['penalties']}")
             if s.get("up_and_downs") is not None:
-                line += f" | Up&Downs: {s['up_and_downs']}"
+                line_parts.append(f" | Up&Downs: {s['up_and_downs']}")
             # Conditions
             if s.get("conditions"):
                 cond = s["conditions"]
@@ -1316,22 +2235,64 @@ def _format_sessions_for_coaching(sessions, limit=30):
                 if cond.get("course_condition"):
                     cond_parts.append(f"course:{cond['course_condition']}")
                 if cond_parts:
-                    line += f" | Conditions: {', '.join(cond_parts)}"
+                    line_parts.append(f" | Conditions: {', '.join(cond_parts)}")
             if s.get("highlights"):
-                line += f" | Highlights: {s['highlights'][:150]}"
+                line_parts.append(f" | Highlights: {s['highlights'][:150]}")
             if s.get("trouble_spots"):
-                line += f" | Trouble: {s['trouble_spots'][:150]}"
+                line_parts.append(f" | Trouble: {s['trouble_spots'][:150]}")
             if s.get("notes"):
-                line += f" | Notes: {s['notes'][:200]}"
-        lines.append(line)
+                line_parts.append(f" | Notes: {s['notes'][:200]}")
+        lines.append("".join(line_parts))
 
     return "\n".join(lines)
 
 
+def _stream_coaching(kind, summary, system, content):
+    """
+    Server-Sent Events response for a coaching reply: each text delta from
+    Claude is sent as a `data: {"delta": ...}` event as soon as it arrives, so
+    the first words show up long before the full reply is done. A cached reply
+    is sent as a single delta; failures are sent as a `data: {"error": ...}`
+    event. The completed reply is cached like the non-streamed endpoints do.
+    """
+    def events():
+        cached = _get_cached_coaching(kind, summary)
+        if cached is not None:
+            yield f"data: {json.dumps({'delta': cached})}\n\n"
+            return
+        try:
+            client = _get_claude_client()
+            parts = []
+            with client.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=1024,
+                system=system,
+                messages=[{"role": "user", "content": content}],
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    yield f"data: {json.dumps({'delta': text})}\n\n"
+            _set_cached_coaching(kind, summary, "".join(parts))
+        except ValueError:
+            error = "ANTHROPIC_API_KEY is not set. Please set it to use AI coaching."
+            yield f"data: {json.dumps({'error': error})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Error getting coaching: {e}'})}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/api/coaching/advice", methods=["GET"])
 @_auth_required
 def get_coaching_advice():
-    """Return AI coaching advice based on the player's session history."""
+    """
+    Return AI coaching advice based on the player's session history.
+    With ?stream=1 the advice is streamed as Server-Sent Events instead.
+    """
     sessions = _read_sessions()
     if not sessions:
         return jsonify(
@@ -1339,34 +2300,24 @@ def get_coaching_advice():
         )
 
     summary = _format_sessions_for_coaching(sessions)
+    advice_prompt = f"Here is my recent practice history:\n\n{summary}\n\nWhat should I work on?"
+    if request.args.get("stream") == "1":
+        return _stream_coaching("advice", summary, _COACHING_ADVICE_SYSTEM, advice_prompt)
+    cached = _get_cached_coaching("advice", summary)
+    if cached is not None:
+        return jsonify({"advice": cached})
 
     try:
         client = _get_claude_client()
         message = client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=1024,
-            system=(
-                "You are a supportive, knowledgeable golf coach analyzing a player's "
-                "practice and play history. You have access to their session data including "
-                "practice areas, round stats (FIR, GIR, putts, penalties, scrambling), feel "
-                "ratings, confidence levels across different parts of their game, pre-session "
-                "intentions, playing conditions, and equipment changes. Give specific, "
-                "actionable advice based on patterns you see. Compare their intentions to "
-                "their actual sessions — are they following through? Look at confidence "
-                "trends — where are they gaining or losing confidence? Analyze their round "
-                "stats to identify the biggest scoring opportunities (e.g., if they're losing "
-                "strokes to penalties or putting). Be encouraging but honest. Keep your "
-                "response to 3-4 short paragraphs. Use a conversational, coach-like tone. "
-                "Reference specific data points from their sessions."
-            ),
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"Here is my recent practice history:\n\n{summary}\n\nWhat should I work on?",
-                }
-            ],
+            system=_COACHING_ADVICE_SYSTEM,
+            messages=[{"role": "user", "content": advice_prompt}],
         )
-        return jsonify({"advice": message.content[0].text})
+        advice = message.content[0].text
+        _set_cached_coaching("advice", summary, advice)
+        return jsonify({"advice": advice})
     except ValueError:
         return jsonify({"advice": "ANTHROPIC_API_KEY is not set. Please set it to use AI coaching."}), 500
     except Exception as e:
@@ -1376,7 +2327,10 @@ def get_coaching_advice():
 @app.route("/api/coaching/summary", methods=["GET"])
 @_auth_required
 def get_coaching_summary():
-    """Return an AI-generated game summary based on session history."""
+    """
+    Return an AI-generated game summary based on session history.
+    With ?stream=1 the summary is streamed as Server-Sent Events instead.
+    """
     sessions = _read_sessions()
     if not sessions:
         return jsonify(
@@ -1384,34 +2338,82 @@ def get_coaching_summary():
         )
 
     summary = _format_sessions_for_coaching(sessions)
+    summary_prompt = f"Here is my recent practice and play history:\n\n{summary}\n\nPlease give me a game summary."
+    if request.args.get("stream") == "1":
+        return _stream_coaching("summary", summary, _COACHING_SUMMARY_SYSTEM, summary_prompt)
+    cached = _get_cached_coaching("summary", summary)
+    if cached is not None:
+        return jsonify({"summary": cached})
 
     try:
         client = _get_claude_client()
         message = client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=1024,
-            system=(
-                "You are a golf analytics assistant providing a comprehensive game summary. "
-                "Analyze the player's data including: practice frequency and focus areas, "
-                "round scoring trends, fairways hit and greens in regulation percentages, "
-                "putting averages, penalty frequency, scrambling rate, confidence trends "
-                "across different game areas, how conditions affected their scores, and any "
-                "equipment changes. Provide a clear, data-driven summary organized around: "
-                "overall trajectory, strengths, areas for improvement, and notable patterns. "
-                "Keep it to 3-4 short paragraphs."
-            ),
+            system=_COACHING_SUMMARY_SYSTEM,
+            messages=[{"role": "user", "content": summary_prompt}],
+        )
+        game_summary = message.content[0].text
+        _set_cached_coaching("summary", summary, game_summary)
+        return jsonify({"summary": game_summary})
+    except ValueError:
+        return jsonify({"summary": "ANTHROPIC_API_KEY is not set. Please set it to use AI features."}), 500
+    except Exception as e:
+        return jsonify({"summary": f"Error generating summary: {e}"}), 500
+
+
+@app.route("/api/coaching/both", methods=["GET"])
+@_auth_required
+def get_coaching_both():
+    """
+    Return AI coaching advice and a game summary together from a single Claude
+    call — one round-trip and one copy of the session history in the prompt.
+    Shares its cache with the advice and summary endpoints.
+    """
+    sessions = _read_sessions()
+    if not sessions:
+        return jsonify({
+            "advice": "I don't have any sessions to analyze yet! Log a few practice sessions or rounds, and I'll be able to give you personalized advice.",
+            "summary": "No sessions logged yet. Start tracking your practice and rounds, and I'll provide a detailed summary of your game!",
+        })
+
+    summary = _format_sessions_for_coaching(sessions)
+    cached_advice = _get_cached_coaching("advice", summary)
+    cached_summary = _get_cached_coaching("summary", summary)
+    if cached_advice is not None and cached_summary is not None:
+        return jsonify({"advice": cached_advice, "summary": cached_summary})
+
+    try:
+        client = _get_claude_client()
+    except ValueError:
+        error = "ANTHROPIC_API_KEY is not set. Please set it to use AI coaching."
+        return jsonify({"advice": error, "summary": error}), 500
+
+    try:
+        message = client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=2048,
+            system=_COACHING_BOTH_SYSTEM,
             messages=[
                 {
                     "role": "user",
-                    "content": f"Here is my recent practice and play history:\n\n{summary}\n\nPlease give me a game summary.",
+                    "content": f"Here is my recent practice and play history:\n\n{summary}\n\nWhat should I work on, and how is my game looking overall?",
                 }
             ],
         )
-        return jsonify({"summary": message.content[0].text})
-    except ValueError:
-        return jsonify({"summary": "ANTHROPIC_API_KEY is not set. Please set it to use AI features."}), 500
+        reply = _parse_claude_json(message.content[0].text)
+        advice, game_summary = reply["advice"], reply["summary"]
+        _set_cached_coaching("advice", summary, advice)
+        _set_cached_coaching("summary", summary, game_summary)
+        return jsonify({"advice": advice, "summary": game_summary})
     except Exception as e:
-        return jsonify({"summary": f"Error generating summary: {e}"}), 500
+        error = f"Error getting coaching: {e}"
+        return jsonify({"advice": error, "summary": error}), 500
+
+
+# Create (and if needed migrate) the data directory once at startup, for both
+# gunicorn and `python app.py`, instead of checking on every request
+_ensure_data_file()
 
 
 # ---------------------------------------------------------------------------
@@ -1419,7 +2421,6 @@ def get_coaching_summary():
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    _ensure_data_file()
     port = int(os.environ.get("PORT", 5000))
     print(f"🏌️ Fairway Tracker API running on http://localhost:{port}")
     app.run(host="0.0.0.0", debug=True, port=port)
@@ -101,11 +101,48 @@ function authFetch(url, options = {}) {
   return fetch(url, { ...options, headers });
 }
 
+// The backend lets the browser reuse /api/stats for a few seconds; after a
+// session is created or deleted the next stats fetch must revalidate instead
+let statsStale = false;
+
+function markStatsStale() {
+  statsStale = true;
+}
+
 async function api(path, options = {}) {
   const res = await authFetch(path, options);
   return res.json();
 }
 
+// Read a Server-Sent Events response, calling onText with the text so far
+// after each delta. Plain JSON replies (e.g. no sessions yet) are passed
+// through whole, read from the given key.
+async function streamText(path, key, onText) {
+  const res = await authFetch(path);
+  if (!(res.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+    const data = await res.json();
+    onText(data[key] || data.error || '');
+    return;
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let text = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const events = buffer.split('\n\n');
+    buffer = events.pop();
+    for (const event of events) {
+      if (!event.startsWith('data: ')) continue;
+      const data = JSON.parse(event.slice(6));
+      text = data.error ? data.error : text + data.delta;
+      onText(text);
+    }
+  }
+}
+
 // ---------------------------------------------------------------------------
 // Animated number component — counts up from 0 to target
 // ---------------------------------------------------------------------------
@@ -793,6 +830,7 @@ function LogSession({ onSaved }) {
     };
 
     await api(`${API_BASE}/sessions`, { method: 'POST', body: JSON.stringify(session) });
+    markStatsStale();
     setSaving(false);
     setSaved(true);
 
@@ -1122,7 +1160,9 @@ function Dashboard() {
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    api(`${API_BASE}/stats`).then(data => { setStats(data); setLoading(false); });
+    const options = statsStale ? { cache: 'no-cache' } : {};
+    statsStale = false;
+    api(`${API_BASE}/stats`, options).then(data => { setStats(data); setLoading(false); });
   }, []);
 
   if (loading) {
@@ -1548,22 +1588,38 @@ function Coaching() {
   async function getAdvice() {
     setLoadingAdvice(true);
     setAdvice('');
-    const data = await api(`${API_BASE}/coaching/advice`);
-    setAdvice(data.advice);
+    await streamText(`${API_BASE}/coaching/advice?stream=1`, 'advice', setAdvice);
     setLoadingAdvice(false);
   }
 
   async function getSummary() {
     setLoadingSummary(true);
     setSummary('');
-    const data = await api(`${API_BASE}/coaching/summary`);
-    setSummary(data.summary);
+    await streamText(`${API_BASE}/coaching/summary?stream=1`, 'summary', setSummary);
+    setLoadingSummary(false);
+  }
+
+  // Both cards from one AI call instead of two
+  async function getBoth() {
+    setLoadingAdvice(true);
+    setLoadingSummary(true);
+    setAdvice('');
+    setSummary('');
+    const data = await api(`${API_BASE}/coaching/both`);
+    setAdvice(data.advice || data.error || '');
+    setSummary(data.summary || data.error || '');
+    setLoadingAdvice(false);
     setLoadingSummary(false);
   }
 
   return (
     <div className="page fade-in">
       <h2>AI Golf Coach</h2>
+      <div className="coaching-both">
+        <button className="coaching-btn" onClick={getBoth} disabled={loadingAdvice || loadingSummary}>
+          {loadingAdvice && loadingSummary ? <><span className="spinner" /> Analyzing...</> : 'Get Advice & Summary'}
+        </button>
+      </div>
       <div className="coaching-grid">
         <div className="coaching-card">
           <div className="coaching-header">
@@ -1705,6 +1761,7 @@ export default function App() {
 
   async function handleDelete(id) {
     await api(`${API_BASE}/sessions/${id}`, { method: 'DELETE' });
+    markStatsStale();
     loadSessions();
   }
 